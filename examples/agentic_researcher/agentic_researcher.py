@@ -15,20 +15,25 @@ Features:
 
 import argparse
 import asyncio
+import importlib.util
 import json
 import os
+import re
 import sys
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, field_validator
 
-# Add parent directory to path
-sys.path.insert(0, "../../")
+# Add parent directory to path for local development, unless the package is
+# installed (pip install -e .) - a path at the front of sys.path is checked by every later import
+if importlib.util.find_spec("pydantic_airtable") is None:
+    sys.path.insert(0, "../../")
 
 from pydantic_airtable import (
     airtable_model,
     configure_from_env,
+    get_global_config,
     AirtableManager,
     AirtableConfig
 )
@@ -38,6 +43,11 @@ from dotenv import load_dotenv
 from research_tools import ResearchTools
 from prompt_loader import PromptLoader
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -56,6 +66,14 @@ research_tools = ResearchTools()
 prompt_loader = PromptLoader()
 
 
+def dump_json(data: Any, indent: bool = False) -> str:
+    """Serialize research data to a JSON string, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option).decode()
+    return json.dumps(data, indent=2 if indent else None)
+
+
 # Enums for better type safety
 class TaskStatus(str, Enum):
     PENDING = "Pending"
@@ -137,7 +155,7 @@ class ResearchStep(BaseModel):
     @classmethod
     def validate_research_data(cls, v):
         if v is not None and isinstance(v, (dict, list)):
-            return json.dumps(v)
+            return dump_json(v)
         return v
 
 
@@ -211,8 +229,7 @@ class AgenticResearcher:
         
         # Get base schema once (more efficient than checking each table separately)
         try:
-            config = AirtableConfig.from_env()
-            manager = AirtableManager(config)
+            manager = self.manager or AirtableManager(get_global_config())
             schema = manager.get_base_schema()
             existing_tables = {t['name']: t['id'] for t in schema.get('tables', [])}
         except Exception as e:
@@ -312,12 +329,19 @@ class AgenticResearcher:
         print(f"✅ Defined {len(steps)} research steps")
         return steps
             
-    async def execute_research_step(self, step: ResearchStep) -> ResearchStep:
+    async def execute_research_step(
+        self,
+        step: ResearchStep,
+        task: Optional[ResearchTask] = None,
+        total_steps: Optional[int] = None
+    ) -> ResearchStep:
         """
         Execute a single research step
         
         Args:
             step: Research step to execute
+            task: Parent research task (fetched from Airtable if None)
+            total_steps: Number of steps in the task (counted from Airtable if None)
             
         Returns:
             Updated ResearchStep instance
@@ -336,10 +360,10 @@ class AgenticResearcher:
             )
             
             # Analyze research data with AI
-            findings = await self._analyze_research_data(step, research_data)
+            findings = await self._analyze_research_data(step, research_data, task, total_steps)
             
             # Update step with results
-            step.research_data = json.dumps(research_data) if research_data else None
+            step.research_data = dump_json(research_data) if research_data else None
             step.findings = findings
             step.source_count = len(research_data.get('sources', [])) if research_data else 0
             step.confidence_score = research_data.get('confidence', 0.7) if research_data else 0.5
@@ -529,7 +553,13 @@ class AgenticResearcher:
                 }
             ]
     
-    async def _analyze_research_data(self, step: ResearchStep, research_data: Dict, task: ResearchTask = None) -> str:
+    async def _analyze_research_data(
+        self,
+        step: ResearchStep,
+        research_data: Dict,
+        task: ResearchTask = None,
+        total_steps: Optional[int] = None
+    ) -> str:
         """Analyze research data using AI"""
         try:
             # Get task information if not provided
@@ -540,11 +570,11 @@ class AgenticResearcher:
                     task = ResearchTask(title="Unknown Task", description="Task information not available")
             
             # Get total step count (estimate if needed)
-            try:
-                all_steps = ResearchStep.find_by(task_id=step.task_id)
-                total_steps = len(all_steps)
-            except Exception:
-                total_steps = 5  # Fallback estimate
+            if total_steps is None:
+                try:
+                    total_steps = ResearchStep.count(task_id=step.task_id)
+                except Exception:
+                    total_steps = 5  # Fallback estimate
             
             system_message, user_message = self.prompt_loader.format_research_execution(
                 step_type_lower=step.step_type.lower() if step.step_type else "research",
@@ -557,7 +587,7 @@ class AgenticResearcher:
                 step_type=step.step_type or "Research",
                 research_query=step.research_query or step.description,
                 context="",  # Additional context if needed
-                research_data=json.dumps(research_data, indent=2)
+                research_data=dump_json(research_data, indent=True)
             )
             
             response = self.openai_client.chat.completions.create(
@@ -620,17 +650,23 @@ class AgenticResearcher:
                 f"Description: {task.description}"
             ]
             
-            if steps:
+            # Only send the most relevant findings and results to keep the prompt small
+            relevant_steps = self._rank_by_relevance(
+                question, [step for step in steps if step.findings], lambda step: step.findings
+            )
+            relevant_results = self._rank_by_relevance(
+                question, [result for result in results if result.content], lambda result: result.content
+            )
+            
+            if relevant_steps:
                 context_parts.append("Research Steps:")
-                for step in steps:
-                    if step.findings:
-                        context_parts.append(f"- {step.title}: {step.findings}")
+                for step in relevant_steps:
+                    context_parts.append(f"- {step.title}: {step.findings}")
             
-            if results:
+            if relevant_results:
                 context_parts.append("Previous Results:")
-                for result in results:
-                    if result.content:
-                        context_parts.append(f"- {result.title}: {result.content[:200]}...")
+                for result in relevant_results:
+                    context_parts.append(f"- {result.title}: {result.content[:200]}...")
             
             context = "\n".join(context_parts)
             
@@ -653,6 +689,30 @@ class AgenticResearcher:
         except Exception as e:
             print(f"⚠️ Question answering failed: {e}")
             return f"Unable to answer: {str(e)}"
+    
+    @staticmethod
+    def _rank_by_relevance(question: str, items: List[Any], get_text, top_k: int = 5) -> List[Any]:
+        """
+        Pick the items whose text shares the most words with the question
+        
+        Args:
+            question: Question being answered
+            items: Candidate items (steps or results)
+            get_text: Callable returning the text of an item
+            top_k: Maximum number of items to keep
+            
+        Returns:
+            Up to top_k items, most relevant first
+        """
+        if len(items) <= top_k:
+            return items
+        
+        question_words = set(re.findall(r"\w+", question.lower()))
+        
+        def score(item) -> int:
+            return len(question_words.intersection(re.findall(r"\w+", get_text(item).lower())))
+        
+        return sorted(items, key=score, reverse=True)[:top_k]
 
 
 # Interactive Interface
@@ -742,7 +802,9 @@ async def interactive_mode():
                 for step in steps:
                     step_status = str(step.status) if step.status else ""
                     if step_status != "Completed":
-                        await researcher.execute_research_step(step)
+                        await researcher.execute_research_step(
+                            step, task=current_task, total_steps=len(steps)
+                        )
                         completed_count += 1
                         
                         # Update task progress
@@ -785,23 +847,25 @@ async def interactive_mode():
                     print("❌ No summary available yet. Complete research first.")
                 
             elif choice == "5":
-                # List all tasks
-                tasks = ResearchTask.all()
-                if tasks:
-                    print(f"\n📚 All Research Tasks ({len(tasks)} total):")
-                    print("=" * 60)
-                    for i, task in enumerate(tasks, 1):
-                        status_str = str(task.status) if task.status else "Unknown"
-                        status_icon = "✅" if status_str == "Completed" else "⏳"
-                        progress_val = float(task.progress) if task.progress else 0.0
-                        print(f"{i}. {status_icon} {task.title}")
-                        print(f"   Status: {status_str} | Progress: {progress_val:.1f}%")
-                        if task.started_at:
-                            try:
-                                print(f"   Started: {task.started_at.strftime('%Y-%m-%d %H:%M')}")
-                            except AttributeError:
-                                print(f"   Started: {task.started_at}")
-                        print()
+                # List all tasks, printing each page as it arrives instead of loading the whole table
+                count = 0
+                for count, task in enumerate(ResearchTask.iter_all(), 1):
+                    if count == 1:
+                        print("\n📚 All Research Tasks:")
+                        print("=" * 60)
+                    status_str = str(task.status) if task.status else "Unknown"
+                    status_icon = "✅" if status_str == "Completed" else "⏳"
+                    progress_val = float(task.progress) if task.progress else 0.0
+                    print(f"{count}. {status_icon} {task.title}")
+                    print(f"   Status: {status_str} | Progress: {progress_val:.1f}%")
+                    if task.started_at:
+                        try:
+                            print(f"   Started: {task.started_at.strftime('%Y-%m-%d %H:%M')}")
+                        except AttributeError:
+                            print(f"   Started: {task.started_at}")
+                    print()
+                if count:
+                    print(f"📚 {count} research task(s) total")
                 else:
                     print("📚 No research tasks found.")
             
@@ -887,7 +951,7 @@ async def demo_mode():
     steps = await researcher.define_research_steps(task)
     
     for step in steps:
-        await researcher.execute_research_step(step)
+        await researcher.execute_research_step(step, task=task, total_steps=len(steps))
     
     # Generate final summary
     final_result = await researcher.generate_final_summary(task)
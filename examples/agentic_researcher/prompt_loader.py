@@ -24,24 +24,36 @@ class PromptLoader:
             self.prompts_dir = Path(__file__).parent / "prompts"
         else:
             self.prompts_dir = Path(prompts_dir)
+        
+        # Parsed prompt files keyed by prompt name
+        self._cache: Dict[str, Dict[str, Any]] = {}
     
     def load_prompt(self, prompt_name: str) -> Dict[str, Any]:
         """
         Load a prompt from a YAML file
         
+        Prompt files are parsed once and served from memory afterwards.
+        
         Args:
             prompt_name: Name of the prompt file (without .yaml extension)
             
         Returns:
             Dictionary containing prompt templates and system messages
         """
+        cached = self._cache.get(prompt_name)
+        if cached is not None:
+            return cached
+        
         prompt_file = self.prompts_dir / f"{prompt_name}.yaml"
         
         if not prompt_file.exists():
             raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
         
         with open(prompt_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            prompt_data = yaml.safe_load(f)
+        
+        self._cache[prompt_name] = prompt_data
+        return prompt_data
     
     def format_keywords_extraction(self, description: str) -> tuple[str, str]:
         """
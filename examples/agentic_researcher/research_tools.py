@@ -48,6 +48,12 @@ class ResearchTools:
         if self.session:
             await self.session.close()
 
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep only for the part of the search delay that hasn't elapsed yet"""
+        remaining = self.search_delay - (time.time() - self.last_search_time)
+        if remaining > 0:
+            time.sleep(remaining)
+
     def web_search(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """
         Perform web search using DuckDuckGo with rate limiting
@@ -63,10 +69,7 @@ class ResearchTools:
             print("⚠️  Web search unavailable - DDGS not initialized")
             return self._create_mock_results(query, max_results)
             
-        # Rate limiting
-        current_time = time.time()
-        if current_time - self.last_search_time < self.search_delay:
-            time.sleep(self.search_delay)
+        self._wait_for_rate_limit()
         
         try:
             results = []
@@ -173,10 +176,7 @@ class ResearchTools:
         try:
             results = []
             
-            # Rate limiting
-            current_time = time.time()
-            if current_time - self.last_search_time < self.search_delay:
-                time.sleep(self.search_delay)
+            self._wait_for_rate_limit()
             
             print(f"📰 Searching news for: {query}")
             news_results = self.ddgs.news(query, max_results=max_results)
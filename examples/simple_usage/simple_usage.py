@@ -2,19 +2,21 @@
 Simple usage example showing the streamlined pydantic-airtable API
 """
 
+import importlib.util
 import sys
 from typing import Optional
 from pydantic import BaseModel
 
-# Add parent directory to path for local development  
-sys.path.insert(0, "../../")
+# Add parent directory to path for local development, unless the package is
+# installed (pip install -e .) - a path at the front of sys.path is checked by every later import
+if importlib.util.find_spec("pydantic_airtable") is None:
+    sys.path.insert(0, "../../")
 
 from pydantic_airtable import (
     airtable_model, 
     configure_from_env, 
     airtable_field, 
     AirtableFieldType,
-    AirtableConfig,
     AirtableManager
 )
 from dotenv import load_dotenv
@@ -23,7 +25,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Configure Airtable connection from environment
-configure_from_env()
+config = configure_from_env()
 
 # Define model with streamlined decorator
 @airtable_model(table_name="Users")  
@@ -52,7 +54,6 @@ def main():
     try:
         # Check if table exists by looking at base schema (more efficient than fetching records)
         print("🔍 Checking if Users table exists...")
-        config = AirtableConfig.from_env()
         manager = AirtableManager(config)
         schema = manager.get_base_schema()
         
@@ -105,18 +106,18 @@ def main():
         # 5. Query users
         print("\n5️⃣ Querying users...")
         
-        # Get all users
+        # Get all users once and keep the list up to date locally afterwards
         all_users = User.all()
         print(f"📊 Total users: {len(all_users)}")
         
-        # Get active users - simple filtering
-        active_users = User.find_by(is_active=True)
-        print(f"📊 Active users: {len(active_users)}")
+        # Count active users - simple filtering, no model instances needed
+        active_count = User.count(is_active=True)
+        print(f"📊 Active users: {active_count}")
         
-        # Multi-field filtering: find active users over 25
-        # find_by supports multiple fields combined with AND logic
-        active_over_25 = User.find_by(is_active=True, age=25)
-        print(f"📊 Active users age 25: {len(active_over_25)}")
+        # Multi-field filtering: count active users aged 25
+        # count/find_by support multiple fields combined with AND logic
+        active_age_25 = User.count(is_active=True, age=25)
+        print(f"📊 Active users age 25: {active_age_25}")
         
         # Get first inactive user  
         inactive_user = User.first(is_active=False)
@@ -135,20 +136,24 @@ def main():
         ]
         
         created_users = User.bulk_create(users_data)
+        all_users.extend(created_users)
         print(f"✅ Batch created {len(created_users)} users")
         
-        # 7. Final count
+        # 7. Final count (no need to fetch everything again)
         print("\n7️⃣ Final user count...")
-        final_users = User.all()
+        final_users = all_users
         print(f"📊 Final total users: {len(final_users)}")
         
         # List all users with their details
-        print("\n👥 All users:")
+        # Build the listing first and write it out in one go
+        lines = ["\n👥 All users:"]
         for u in final_users:
+            bio = u.bio
             status = "✓" if u.is_active else "✗"
-            bio_preview = (u.bio[:30] + "...") if u.bio and len(u.bio) > 30 else (u.bio or "No bio")
-            print(f"  {status} {u.name} ({u.email}) - Age: {u.age}")
-            print(f"     Bio: {bio_preview}")
+            bio_preview = (bio[:30] + "...") if bio and len(bio) > 30 else (bio or "No bio")
+            lines.append(f"  {status} {u.name} ({u.email}) - Age: {u.age}")
+            lines.append(f"     Bio: {bio_preview}")
+        print("\n".join(lines))
         
         print("\n🎉 Example completed successfully!")
         print("\n💡 Key features demonstrated:")
@@ -13,15 +13,19 @@ Features demonstrated:
 - Table schema management
 """
 
+import importlib.util
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-# Add parent directory to path for local development
-sys.path.insert(0, "../../")
+# Add parent directory to path for local development, unless the package is
+# installed (pip install -e .) - a path at the front of sys.path is checked by every later import
+if importlib.util.find_spec("pydantic_airtable") is None:
+    sys.path.insert(0, "../../")
 
 from pydantic_airtable import (
     airtable_model, 
@@ -29,15 +33,15 @@ from pydantic_airtable import (
     airtable_field,
     AirtableFieldType,
     AirtableManager,
-    AirtableConfig,
     APIError
 )
 
 # Load environment variables
 load_dotenv()
 
-# Configure from environment
-configure_from_env()
+# Configure from environment and share one manager across all demonstrations
+config = configure_from_env()
+manager = AirtableManager(config)
 
 # Define Enums for better type safety
 class TaskStatus(str, Enum):
@@ -146,14 +150,98 @@ class Project(BaseModel):
     # )
 
 
+# Extended models used by demonstrate_table_management to show schema sync.
+# Defined once at import time rather than rebuilt on every call.
+
+# Extended Task model with new fields
+@airtable_model(table_name="Tasks")
+class TaskExtended(BaseModel):
+    """Extended Task model with additional fields for schema sync demo"""
+    # Original fields
+    title: str
+    description: Optional[str] = None
+    status: TaskStatus = TaskStatus.PENDING
+    priority: Priority = Priority.MEDIUM
+    completed: bool = False
+    due_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    tags: Optional[str] = airtable_field(
+        field_type=AirtableFieldType.MULTI_SELECT,
+        choices=["urgent", "important", "work", "personal", "review"],
+        default=None
+    )
+    project_ids: Optional[List[str]] = airtable_field(
+        field_type=AirtableFieldType.LINKED_RECORD,
+        field_name="Projects",
+        default=None
+    )
+    # NEW FIELDS for sync demonstration
+    estimated_hours: Optional[float] = airtable_field(
+        field_type=AirtableFieldType.NUMBER,
+        default=None
+    )
+    assigned_to: Optional[str] = None  # Will be detected as SINGLE_LINE_TEXT
+    notes: Optional[str] = None        # Will be detected as LONG_TEXT
+
+
+# Extended Employee model with new fields
+@airtable_model(table_name="Employees")
+class EmployeeExtended(BaseModel):
+    """Extended Employee model with additional fields for schema sync demo"""
+    # Original fields
+    name: str
+    email: str
+    phone: Optional[str] = None
+    bio: Optional[str] = None
+    website: Optional[str] = None
+    is_admin: bool = False
+    salary: Optional[float] = None
+    # NEW FIELDS for sync demonstration
+    department: Optional[str] = None   # Will be SINGLE_LINE_TEXT
+    hire_date: Optional[datetime] = None  # Will be DATETIME
+    is_active: bool = True             # Will be CHECKBOX
+
+
+# Extended Project model with new fields
+@airtable_model(table_name="Projects")
+class ProjectExtended(BaseModel):
+    """Extended Project model with additional fields for schema sync demo"""
+    # Original fields
+    name: str
+    description: str
+    budget: Optional[float] = airtable_field(
+        field_type=AirtableFieldType.CURRENCY,
+        default=None
+    )
+    completion_rate: Optional[float] = airtable_field(
+        field_type=AirtableFieldType.PERCENT,
+        default=None
+    )
+    status: str = airtable_field(
+        field_type=AirtableFieldType.SELECT,
+        choices=["Planning", "Active", "On Hold", "Completed"],
+        default="Planning"
+    )
+    team_size: Optional[int] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    # NEW FIELDS for sync demonstration
+    project_code: Optional[str] = None    # Will be SINGLE_LINE_TEXT
+    risk_level: Optional[str] = airtable_field(
+        field_type=AirtableFieldType.SELECT,
+        choices=["Low", "Medium", "High", "Critical"],
+        default=None
+    )
+    notes: Optional[str] = None           # Will be detected as LONG_TEXT
+
+
 def demonstrate_table_creation():
     """
     Demonstrate automatic table creation from models.
     
     Creates tables in the correct order to handle LINKED_RECORD dependencies:
-    1. Projects table (no dependencies)
-    2. Employees table (no dependencies)
-    3. Tasks table (depends on Projects for LINKED_RECORD field)
+    1. Projects and Employees tables (no dependencies, created concurrently)
+    2. Tasks table (depends on Projects for LINKED_RECORD field)
     """
     global _projects_table_id
     
@@ -162,13 +250,23 @@ def demonstrate_table_creation():
     print("="*60)
     
     print("\n💡 Creating tables in order to handle LINKED_RECORD dependencies...")
-    print("   Projects → Employees → Tasks (Tasks links to Projects)")
+    print("   Projects + Employees → Tasks (Tasks links to Projects)")
     
     failed_tables = []
     
-    # Step 1: Create Projects table first (Tasks will link to it)
-    print(f"\n📋 Step 1: Creating Projects table...")
-    projects_table_id = _create_or_get_table(Project, "Projects", failed_tables)
+    # Fetch the base schema once and share it across all existence checks
+    try:
+        existing_tables = {
+            table['name']: table for table in manager.get_base_schema().get('tables', [])
+        }
+    except APIError as e:
+        print(f"❌ API error while fetching base schema: {e}")
+        print(f"   Status code: {e.status_code}")
+        return False
+    
+    # Step 1: Projects and Employees don't depend on anything, so create them concurrently
+    print(f"\n📋 Step 1: Creating Projects and Employees tables concurrently...")
+    projects_table_id, _ = _create_independent_tables(existing_tables, failed_tables)
     
     if projects_table_id:
         _projects_table_id = projects_table_id
@@ -177,13 +275,9 @@ def demonstrate_table_creation():
         # Update Task model's linked_table_id for the project_ids field
         _update_task_linked_table_id(projects_table_id)
     
-    # Step 2: Create Employees table (no dependencies)
-    print(f"\n📋 Step 2: Creating Employees table...")
-    _create_or_get_table(Employee, "Employees", failed_tables)
-    
-    # Step 3: Create Tasks table (with LINKED_RECORD to Projects)
-    print(f"\n📋 Step 3: Creating Tasks table (with link to Projects)...")
-    _create_or_get_table(Task, "Tasks", failed_tables)
+    # Step 2: Create Tasks table (with LINKED_RECORD to Projects)
+    print(f"\n📋 Step 2: Creating Tasks table (with link to Projects)...")
+    _create_or_get_table(Task, "Tasks", existing_tables, failed_tables)
     
     # Return success status
     if failed_tables:
@@ -194,32 +288,60 @@ def demonstrate_table_creation():
         return True
 
 
-def _create_or_get_table(model_class, table_name: str, failed_tables: list) -> Optional[str]:
+def _create_independent_tables(existing_tables: dict, failed_tables: list) -> List[Optional[str]]:
+    """
+    Create the Projects and Employees tables concurrently.
+    
+    Returns:
+        Table IDs for Projects and Employees (None for failures)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        projects = executor.submit(_create_or_get_table, Project, "Projects", existing_tables, failed_tables)
+        employees = executor.submit(_create_or_get_table, Employee, "Employees", existing_tables, failed_tables)
+        return [projects.result(), employees.result()]
+
+
+def _sync_models(model_classes) -> list:
+    """
+    Sync several models' tables concurrently.
+    
+    Returns:
+        Sync results in model order (the raised exception for failures)
+    """
+    def sync(model_class):
+        try:
+            return model_class.sync_table(create_missing_fields=True, update_field_types=False)
+        except Exception as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        return list(executor.map(sync, model_classes))
+
+
+def _create_or_get_table(
+    model_class, 
+    table_name: str, 
+    existing_tables: dict, 
+    failed_tables: list
+) -> Optional[str]:
     """
     Create a table or get existing table ID.
     
-    Checks the base schema to see if table exists (more efficient than
-    fetching records). Creates the table if it doesn't exist.
+    Checks the already-fetched base schema to see if the table exists
+    (more efficient than fetching records). Creates the table if it doesn't exist.
     
     Returns:
         Table ID if successful, None otherwise
     """
-    import time
-    
     try:
-        # Check base schema to see if table already exists
-        config = AirtableConfig.from_env()
-        manager = AirtableManager(config)
-        schema = manager.get_base_schema()
-        
-        # Look for table in schema
-        for table in schema.get('tables', []):
-            if table['name'] == table_name:
-                table_id = table['id']
-                record_count = len(table.get('fields', []))
-                print(f"✅ {table_name} table already exists")
-                print(f"   Table ID: {table_id} ({record_count} fields)")
-                return table_id
+        # Look for table in the base schema
+        table = existing_tables.get(table_name)
+        if table:
+            table_id = table['id']
+            record_count = len(table.get('fields', []))
+            print(f"✅ {table_name} table already exists")
+            print(f"   Table ID: {table_id} ({record_count} fields)")
+            return table_id
         
         # Table not found in schema - create it
         print(f"ℹ️  {table_name} table does not exist yet")
@@ -230,8 +352,8 @@ def _create_or_get_table(model_class, table_name: str, failed_tables: list) -> O
         print(f"✅ Created {table_name} table successfully!")
         print(f"   Table ID: {table_id}")
         
-        # Wait a moment for table to be ready
-        time.sleep(1)
+        # Wait only as long as it takes for the new table to accept requests
+        _wait_until_table_ready(model_class)
         
         return table_id
         
@@ -248,6 +370,28 @@ def _create_or_get_table(model_class, table_name: str, failed_tables: list) -> O
         return None
 
 
+def _wait_until_table_ready(model_class, max_attempts: int = 6) -> bool:
+    """
+    Poll a newly created table until it answers a record query.
+    
+    Starts with an immediate check and backs off exponentially (capped at 2s),
+    instead of always sleeping a fixed amount of time.
+    
+    Returns:
+        True if the table became ready, False otherwise
+    """
+    import time
+    
+    for attempt in range(max_attempts):
+        try:
+            model_class.all(maxRecords=1)
+            return True
+        except APIError:
+            time.sleep(min(2.0, 0.1 * 1.7 ** attempt))
+    
+    return False
+
+
 def _update_task_linked_table_id(projects_table_id: str):
     """
     Update the Task model's project_ids field with the Projects table ID.
@@ -263,6 +407,14 @@ def _update_task_linked_table_id(projects_table_id: str):
             print(f"   ✅ Updated Task.project_ids with linked_table_id")
 
 
+def _filter_records(records: list, **criteria) -> list:
+    """Filter already-fetched records by field values (AND logic, like find_by)"""
+    return [
+        record for record in records
+        if all(getattr(record, field) == value for field, value in criteria.items())
+    ]
+
+
 def demonstrate_crud_operations() -> bool:
     """
     Demonstrate CRUD operations with the new models including LINKED_RECORD.
@@ -276,28 +428,39 @@ def demonstrate_crud_operations() -> bool:
     print("📝 CRUD OPERATIONS DEMONSTRATION") 
     print("="*60)
     
-    # Create sample project first (so we can link tasks to it)
-    print("\n1️⃣ Creating sample project first (for linking tasks)...")
+    # Create sample projects first (so we can link tasks to them).
+    # Both go in one batch request; the second one is used in step 6.
+    print("\n1️⃣ Creating sample projects first (for linking tasks)...")
     
     try:
-        project = Project.create(
-            name="Mobile App Redesign",
-            description="Complete overhaul of the mobile application user interface and user experience",
-            budget=150000.0,        # CURRENCY field
-            completion_rate=0.25,   # PERCENT field  
-            status="Active",        # SELECT field
-            team_size=5,
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 6, 30)
-        )
+        project, project2 = Project.bulk_create([
+            {
+                "name": "Mobile App Redesign",
+                "description": "Complete overhaul of the mobile application user interface and user experience",
+                "budget": 150000.0,        # CURRENCY field
+                "completion_rate": 0.25,   # PERCENT field  
+                "status": "Active",        # SELECT field
+                "team_size": 5,
+                "start_date": datetime(2024, 1, 1),
+                "end_date": datetime(2024, 6, 30)
+            },
+            {
+                "name": "API Integration",
+                "description": "Build REST API integrations for third-party services",
+                "budget": 75000.0,
+                "status": "Planning",
+                "team_size": 3
+            },
+        ])
         
         print(f"✅ Created project: {project.name}")
         print(f"   Project record ID: {project.id}")
+        print(f"✅ Created second project: {project2.name}")
         
     except Exception as project_error:
-        print(f"❌ Failed to create project: {project_error}")
+        print(f"❌ Failed to create projects: {project_error}")
         print(f"   Error type: {type(project_error).__name__}")
-        project = None
+        project = project2 = None
         success = False
     
     # Create sample tasks linked to the project
@@ -307,25 +470,27 @@ def demonstrate_crud_operations() -> bool:
     print(f"🔍 Debug: Task table name is '{Task._get_table_name()}'")
     
     try:
-        # Create task linked to the project using LINKED_RECORD field
-        task1 = Task.create(
-            title="Design user interface",
-            description="Create wireframes and mockups for the new dashboard",
-            status=TaskStatus.IN_PROGRESS,
-            priority=Priority.HIGH,
-            due_date=datetime(2024, 12, 31),
-            # Link to project using record ID (LINKED_RECORD field)
-            project_ids=[project.id] if project else None
-        )
-        
-        task2 = Task.create(
-            title="Write documentation", 
-            description="Complete API documentation and user guides",
-            status=TaskStatus.PENDING,
-            priority=Priority.MEDIUM,
-            # Also link to the same project
-            project_ids=[project.id] if project else None
-        )
+        # Create both tasks in a single batch request, linked to the project
+        # using the LINKED_RECORD field
+        task1, task2 = Task.bulk_create([
+            {
+                "title": "Design user interface",
+                "description": "Create wireframes and mockups for the new dashboard",
+                "status": TaskStatus.IN_PROGRESS,
+                "priority": Priority.HIGH,
+                "due_date": datetime(2024, 12, 31),
+                # Link to project using record ID (LINKED_RECORD field)
+                "project_ids": [project.id] if project else None
+            },
+            {
+                "title": "Write documentation",
+                "description": "Complete API documentation and user guides",
+                "status": TaskStatus.PENDING,
+                "priority": Priority.MEDIUM,
+                # Also link to the same project
+                "project_ids": [project.id] if project else None
+            }
+        ])
         
         print(f"✅ Created tasks: {task1.title} and {task2.title}")
         if project:
@@ -345,23 +510,24 @@ def demonstrate_crud_operations() -> bool:
     print("\n3️⃣ Creating sample users...")
     
     try:
-        employee1 = Employee.create(
-            name="Alice Johnson",
-            email="alice@example.com",  # Auto-detected as EMAIL type
-            phone="555-0123",           # Auto-detected as PHONE type 
-            bio="Senior software engineer with 8 years experience",
-            website="https://alice.dev",  # Auto-detected as URL type
-            is_admin=True,
-            salary=95000.0
-        )
-        
-        employee2 = Employee.create(
-            name="Bob Smith",
-            email="bob@example.com",
-            bio="Product manager focused on user experience",
-            is_admin=False,
-            salary=85000.0
-        )
+        employee1, employee2 = Employee.bulk_create([
+            {
+                "name": "Alice Johnson",
+                "email": "alice@example.com",  # Auto-detected as EMAIL type
+                "phone": "555-0123",           # Auto-detected as PHONE type
+                "bio": "Senior software engineer with 8 years experience",
+                "website": "https://alice.dev",  # Auto-detected as URL type
+                "is_admin": True,
+                "salary": 95000.0
+            },
+            {
+                "name": "Bob Smith",
+                "email": "bob@example.com",
+                "bio": "Product manager focused on user experience",
+                "is_admin": False,
+                "salary": 85000.0
+            }
+        ])
         
         print(f"✅ Created employees: {employee1.name} and {employee2.name}")
     except Exception as user_error:
@@ -372,30 +538,34 @@ def demonstrate_crud_operations() -> bool:
     print("\n4️⃣ Demonstrating queries...")
     
     try:
-        # Find high priority tasks
-        high_priority_tasks = Task.find_by(priority=Priority.HIGH)
-        print(f"📊 High priority tasks: {len(high_priority_tasks)}")
+        # Fetch tasks once and run all task queries locally instead of
+        # sending a separate filterByFormula request for each one
+        all_tasks = Task.all()
         
+        # Find high priority tasks
+        high_priority_tasks = _filter_records(all_tasks, priority=Priority.HIGH)
         # Show linked project info for tasks
+        lines = [f"📊 High priority tasks: {len(high_priority_tasks)}"]
         for task in high_priority_tasks:
             if task.project_ids:
-                print(f"   📎 Task '{task.title}' linked to {len(task.project_ids)} project(s)")
+                lines.append(f"   📎 Task '{task.title}' linked to {len(task.project_ids)} project(s)")
+        print("\n".join(lines))
         
-        # Find admin employees
-        admin_employees = Employee.find_by(is_admin=True)
-        print(f"📊 Admin employees: {len(admin_employees)}")
+        # Count admin employees (only the number is shown, so no model instances are needed)
+        admin_count = Employee.count(is_admin=True)
+        print(f"📊 Admin employees: {admin_count}")
         
-        # Find active projects
-        active_projects = Project.find_by(status="Active")
-        print(f"📊 Active projects: {len(active_projects)}")
+        # Count active projects
+        active_projects_count = Project.count(status="Active")
+        print(f"📊 Active projects: {active_projects_count}")
         
         # Multi-field filtering example: find high priority incomplete tasks
-        # find_by supports multiple field filters combined with AND logic
-        high_priority_incomplete = Task.find_by(priority=Priority.HIGH, completed=False)
+        # (find_by accepts the same multi-field filters, combined with AND logic)
+        high_priority_incomplete = _filter_records(all_tasks, priority=Priority.HIGH, completed=False)
         print(f"📊 High priority incomplete tasks: {len(high_priority_incomplete)}")
         
         # Another multi-field example: find in-progress tasks with specific status
-        in_progress_tasks = Task.find_by(status=TaskStatus.IN_PROGRESS, completed=False)
+        in_progress_tasks = _filter_records(all_tasks, status=TaskStatus.IN_PROGRESS, completed=False)
         print(f"📊 In-progress tasks (not completed): {len(in_progress_tasks)}")
     except Exception as query_error:
         print(f"❌ Failed during queries: {query_error}")
@@ -421,16 +591,10 @@ def demonstrate_crud_operations() -> bool:
     # Demonstrate updating linked records
     print("\n6️⃣ Demonstrating LINKED_RECORD operations...")
     
-    # Create another project
+    # Link a task to the second project created in step 1
     try:
-        project2 = Project.create(
-            name="API Integration",
-            description="Build REST API integrations for third-party services",
-            budget=75000.0,
-            status="Planning",
-            team_size=3
-        )
-        print(f"✅ Created second project: {project2.name}")
+        if project2 is None:
+            raise ValueError("second project was not created")
         
         # Update task to link to multiple projects
         if task2.project_ids:
@@ -466,19 +630,14 @@ def demonstrate_table_management() -> bool:
     print("⚙️  TABLE MANAGEMENT DEMONSTRATION")
     print("="*60)
     
-    # Get the manager
-    config = AirtableConfig.from_env()
-    manager = AirtableManager(config)
-    
     print("\n1️⃣ Listing all tables in base...")
     try:
         base_schema = manager.get_base_schema()
         tables = base_schema.get('tables', [])
         
-        print(f"📊 Found {len(tables)} tables in base:")
-        for table in tables:
-            fields_count = len(table.get('fields', []))
-            print(f"   📋 {table['name']}: {fields_count} fields")
+        print("\n".join([f"📊 Found {len(tables)} tables in base:"] + [
+            f"   📋 {table['name']}: {len(table.get('fields', ()))} fields" for table in tables
+        ]))
         
     except Exception as e:
         print(f"❌ Failed to list tables: {e}")
@@ -490,86 +649,7 @@ def demonstrate_table_management() -> bool:
     print("   We'll define extended versions of our models with new fields,")
     print("   then sync them to add those fields to the Airtable tables.")
     
-    # Define extended Task model with new fields
-    @airtable_model(table_name="Tasks")
-    class TaskExtended(BaseModel):
-        """Extended Task model with additional fields for schema sync demo"""
-        # Original fields
-        title: str
-        description: Optional[str] = None
-        status: TaskStatus = TaskStatus.PENDING
-        priority: Priority = Priority.MEDIUM
-        completed: bool = False
-        due_date: Optional[datetime] = None
-        created_at: Optional[datetime] = None
-        tags: Optional[str] = airtable_field(
-            field_type=AirtableFieldType.MULTI_SELECT,
-            choices=["urgent", "important", "work", "personal", "review"],
-            default=None
-        )
-        project_ids: Optional[List[str]] = airtable_field(
-            field_type=AirtableFieldType.LINKED_RECORD,
-            field_name="Projects",
-            default=None
-        )
-        # NEW FIELDS for sync demonstration
-        estimated_hours: Optional[float] = airtable_field(
-            field_type=AirtableFieldType.NUMBER,
-            default=None
-        )
-        assigned_to: Optional[str] = None  # Will be detected as SINGLE_LINE_TEXT
-        notes: Optional[str] = None        # Will be detected as LONG_TEXT
-    
-    # Define extended Employee model with new fields
-    @airtable_model(table_name="Employees")
-    class EmployeeExtended(BaseModel):
-        """Extended Employee model with additional fields for schema sync demo"""
-        # Original fields
-        name: str
-        email: str
-        phone: Optional[str] = None
-        bio: Optional[str] = None
-        website: Optional[str] = None
-        is_admin: bool = False
-        salary: Optional[float] = None
-        # NEW FIELDS for sync demonstration
-        department: Optional[str] = None   # Will be SINGLE_LINE_TEXT
-        hire_date: Optional[datetime] = None  # Will be DATETIME
-        is_active: bool = True             # Will be CHECKBOX
-    
-    # Define extended Project model with new fields  
-    @airtable_model(table_name="Projects")
-    class ProjectExtended(BaseModel):
-        """Extended Project model with additional fields for schema sync demo"""
-        # Original fields
-        name: str
-        description: str
-        budget: Optional[float] = airtable_field(
-            field_type=AirtableFieldType.CURRENCY,
-            default=None
-        )
-        completion_rate: Optional[float] = airtable_field(
-            field_type=AirtableFieldType.PERCENT,
-            default=None
-        )
-        status: str = airtable_field(
-            field_type=AirtableFieldType.SELECT,
-            choices=["Planning", "Active", "On Hold", "Completed"],
-            default="Planning"
-        )
-        team_size: Optional[int] = None
-        start_date: Optional[datetime] = None
-        end_date: Optional[datetime] = None
-        # NEW FIELDS for sync demonstration
-        project_code: Optional[str] = None    # Will be SINGLE_LINE_TEXT
-        risk_level: Optional[str] = airtable_field(
-            field_type=AirtableFieldType.SELECT,
-            choices=["Low", "Medium", "High", "Critical"],
-            default=None
-        )
-        notes: Optional[str] = None           # Will be detected as LONG_TEXT
-    
-    print("\n   📋 Extended models defined with new fields:")
+    print("\n   📋 Extended models (defined at module level) add new fields:")
     print("      • TaskExtended: +estimated_hours, +assigned_to, +notes")
     print("      • EmployeeExtended: +department, +hire_date, +is_active")
     print("      • ProjectExtended: +project_code, +risk_level, +notes")
@@ -583,43 +663,46 @@ def demonstrate_table_management() -> bool:
     
     print("\n3️⃣ Synchronizing extended models to add new fields...")
     
-    for table_name, model_class in extended_models:
+    # The three syncs are independent, so run them concurrently and report afterwards
+    sync_results = _sync_models(model_class for _, model_class in extended_models)
+    
+    for (table_name, _), sync_result in zip(extended_models, sync_results):
         print(f"\n🔄 Synchronizing {table_name} table with extended model...")
         
-        try:
-            sync_result = model_class.sync_table(
-                create_missing_fields=True,
-                update_field_types=False
-            )
-            
-            fields_created = sync_result.get('fields_created', [])
-            fields_updated = sync_result.get('fields_updated', [])
-            fields_skipped = sync_result.get('fields_skipped', [])
-            
-            print(f"✅ Sync completed for {table_name}:")
-            print(f"   📝 Fields created: {len(fields_created)}")
-            if fields_created:
-                for field in fields_created:
-                    print(f"      • {field}")
-            print(f"   🔄 Fields updated: {len(fields_updated)}")
-            print(f"   ⏭️  Fields skipped: {len(fields_skipped)}")
-            
-        except Exception as e:
-            print(f"❌ Sync failed for {table_name}: {e}")
+        if isinstance(sync_result, Exception):
+            print(f"❌ Sync failed for {table_name}: {sync_result}")
             success = False
+            continue
+        
+        fields_created = sync_result.get('fields_created', [])
+        fields_updated = sync_result.get('fields_updated', [])
+        fields_skipped = sync_result.get('fields_skipped', [])
+        
+        print(f"✅ Sync completed for {table_name}:")
+        print(f"   📝 Fields created: {len(fields_created)}")
+        if fields_created:
+            for field in fields_created:
+                print(f"      • {field}")
+        print(f"   🔄 Fields updated: {len(fields_updated)}")
+        print(f"   ⏭️  Fields skipped: {len(fields_skipped)}")
     
     # Show final schema
     print("\n4️⃣ Verifying updated table schemas...")
     try:
-        updated_schema = manager.get_base_schema()
-        for table in updated_schema.get('tables', []):
-            if table['name'] in ['Tasks', 'Employees', 'Projects']:
+        # Bypass the schema cache so this really checks what Airtable now has
+        updated_schema = manager.get_base_schema(force_refresh=True)
+        tables_by_name = {table['name']: table for table in updated_schema.get('tables', [])}
+        lines = []
+        for table_name in ('Tasks', 'Employees', 'Projects'):
+            table = tables_by_name.get(table_name)
+            if table:
                 fields = table.get('fields', [])
-                print(f"\n   📋 {table['name']}: {len(fields)} fields")
+                lines.append(f"\n   📋 {table['name']}: {len(fields)} fields")
                 for field in fields[:10]:  # Show first 10 fields
-                    print(f"      • {field['name']} ({field['type']})")
+                    lines.append(f"      • {field['name']} ({field['type']})")
                 if len(fields) > 10:
-                    print(f"      ... and {len(fields) - 10} more fields")
+                    lines.append(f"      ... and {len(fields) - 10} more fields")
+        print("\n".join(lines))
     except Exception as e:
         print(f"⚠️  Could not verify schemas: {e}")
     
@@ -639,12 +722,14 @@ def demonstrate_base_operations() -> bool:
     print("🗄️  BASE OPERATIONS DEMONSTRATION") 
     print("="*60)
     
-    config = AirtableConfig.from_env()
-    manager = AirtableManager(config)
+    # Listing bases and reading the current base's schema are independent, so fetch both at once
+    bases, schema = _fetch_base_overview()
     
     print("\n1️⃣ Listing accessible bases...")
-    try:
-        bases = manager.list_bases()
+    if isinstance(bases, Exception):
+        print(f"❌ Failed to list bases: {bases}")
+        success = False
+    else:
         print(f"📊 Found {len(bases)} accessible bases:")
         
         for base in bases[:3]:  # Show first 3 bases
@@ -652,28 +737,33 @@ def demonstrate_base_operations() -> bool:
             
         if len(bases) > 3:
             print(f"   ... and {len(bases) - 3} more bases")
-            
-    except Exception as e:
-        print(f"❌ Failed to list bases: {e}")
-        success = False
     
     print(f"\n2️⃣ Getting schema for current base ({config.base_id})...")
-    try:
-        schema = manager.get_base_schema()
+    if isinstance(schema, Exception):
+        print(f"❌ Failed to get base schema: {schema}")
+        success = False
+    else:
         tables = schema.get('tables', [])
         
-        print(f"📋 Base contains {len(tables)} tables:")
-        for table in tables:
-            fields = table.get('fields', [])
-            print(f"   📋 {table['name']}: {len(fields)} fields")
-        
-    except Exception as e:
-        print(f"❌ Failed to get base schema: {e}")
-        success = False
+        print("\n".join([f"📋 Base contains {len(tables)} tables:"] + [
+            f"   📋 {table['name']}: {len(table.get('fields', ()))} fields" for table in tables
+        ]))
     
     return success
 
 
+def _fetch_base_overview() -> list:
+    """
+    List accessible bases and get the current base's schema concurrently.
+    
+    Returns:
+        [bases, schema] (the raised exception in place of a failed result)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(manager.list_bases), executor.submit(manager.get_base_schema)]
+    return [future.exception() or future.result() for future in futures]
+
+
 def main():
     """Main demonstration function"""
     
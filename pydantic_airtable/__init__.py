@@ -23,12 +23,12 @@ Quick Start:
     all_users = User.all()
 """
 
-# Core API
-from .models import AirtableModel, airtable_model
+from typing import TYPE_CHECKING
+
+# Core API - lightweight modules are imported eagerly
 from .config import AirtableConfig, configure_from_env, set_global_config, get_global_config
 from .field_types import airtable_field, FieldTypeResolver
 from .fields import AirtableFieldType, AirtableField
-from .manager import AirtableManager
 from .exceptions import (
     AirtableError, 
     RecordNotFoundError, 
@@ -37,9 +37,40 @@ from .exceptions import (
     ConfigurationError
 )
 
-# Internal components (for advanced usage)
-from .http_client import BaseHTTPClient
-from .client import AirtableClient
+# Modules that pull in ``requests`` are only imported when first accessed
+# (PEP 562), so e.g. loading AirtableConfig doesn't pay for the HTTP stack.
+# Type checkers and IDEs see them as regular imports.
+if TYPE_CHECKING:
+    from .models import AirtableModel, airtable_model
+    from .manager import AirtableManager
+    from .http_client import BaseHTTPClient
+    from .client import AirtableClient
+
+    model = airtable_model
+
+_LAZY_IMPORTS = {
+    "AirtableModel": (".models", "AirtableModel"),
+    "airtable_model": (".models", "airtable_model"),
+    "model": (".models", "airtable_model"),
+    "AirtableManager": (".manager", "AirtableManager"),
+    # Internal components (for advanced usage)
+    "BaseHTTPClient": (".http_client", "BaseHTTPClient"),
+    "AirtableClient": (".client", "AirtableClient"),
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __version__ = "1.0.1"
 
@@ -78,7 +109,6 @@ __all__ = [
 
 # Convenience aliases for most common use cases
 configure = configure_from_env
-model = airtable_model
 field = airtable_field
 
 # Version info
@@ -36,11 +36,15 @@ class AirtableConfig:
         elif api_key is not None and access_token is not None:
             raise ValueError("Cannot specify both 'access_token' and 'api_key'. Use 'access_token' only.")
 
+        # Read the environment once; it's consulted again for the deprecation warning below
+        env_access_token = os.getenv("AIRTABLE_ACCESS_TOKEN")
+        env_api_key = os.getenv("AIRTABLE_API_KEY")
+        
         # Try new environment variable first, then fall back to old one for compatibility
         self.access_token = (
             access_token or 
-            os.getenv("AIRTABLE_ACCESS_TOKEN") or 
-            os.getenv("AIRTABLE_API_KEY")  # Backward compatibility
+            env_access_token or 
+            env_api_key  # Backward compatibility
         )
         
         self.base_id = base_id or os.getenv("AIRTABLE_BASE_ID")
@@ -59,7 +63,7 @@ class AirtableConfig:
             )
 
         # Also warn if using deprecated environment variable
-        if not access_token and not api_key and os.getenv("AIRTABLE_API_KEY") and not os.getenv("AIRTABLE_ACCESS_TOKEN"):
+        if not access_token and not api_key and env_api_key and not env_access_token:
             import warnings
             warnings.warn(
                 "AIRTABLE_API_KEY environment variable is deprecated. "
@@ -119,6 +123,10 @@ class AirtableModel(BaseModel, metaclass=AirtableModelMeta):
     # Configuration (to be set in subclasses)
     AirtableConfig: ClassVar[Optional[AirtableConfig]] = None
 
+    # Field mappings (and their Airtable name -> mapping index), computed once per model class
+    _field_mappings: ClassVar[Optional[Dict[str, Dict[str, Any]]]] = None
+    _reverse_field_mappings: ClassVar[Optional[Dict[str, Dict[str, Any]]]] = None
+
     def __init__(self, **data):
         super().__init__(**data)
         self._client: Optional[AirtableClient] = None
@@ -252,6 +260,10 @@ class AirtableModel(BaseModel, metaclass=AirtableModelMeta):
     @classmethod
     def _get_field_mappings(cls) -> Dict[str, Dict[str, Any]]:
         """Get field mappings between Python and Airtable field names"""
+        cached = cls.__dict__.get('_field_mappings')
+        if cached is not None:
+            return cached
+
         mappings = {}
 
         for field_name, field_info in cls.model_fields.items():
@@ -274,9 +286,13 @@ class AirtableModel(BaseModel, metaclass=AirtableModelMeta):
             mappings[field_name] = {
                 'airtable_name': airtable_field_name,
                 'airtable_type': airtable_field_type,
-                'read_only': read_only
+                'read_only': read_only,
+                # Converters are chosen once here rather than per value
+                'format': TypeMapper.make_formatter(airtable_field_type),
+                'parse': TypeMapper.make_parser(airtable_field_type),
             }
 
+        cls._field_mappings = mappings
         return mappings
 
     def _to_airtable_fields(self, exclude_readonly: bool = True) -> Dict[str, Any]:
@@ -296,26 +312,14 @@ class AirtableModel(BaseModel, metaclass=AirtableModelMeta):
                 continue
 
             if value is not None:
-                formatted_value = TypeMapper.format_value_for_airtable(
-                    value, mapping['airtable_type']
-                )
-                airtable_fields[mapping['airtable_name']] = formatted_value
+                airtable_fields[mapping['airtable_name']] = mapping['format'](value)
 
         return airtable_fields
 
     @classmethod
     def _from_airtable_record(cls, record_data: Dict[str, Any]) -> 'AirtableModel':
         """Create model instance from Airtable record data"""
-        field_mappings = cls._get_field_mappings()
-
-        # Create reverse mapping (Airtable name -> Python name)
-        reverse_mappings = {
-            mapping['airtable_name']: {
-                'python_name': field_name,
-                'airtable_type': mapping['airtable_type']
-            }
-            for field_name, mapping in field_mappings.items()
-        }
+        reverse_mappings = cls._get_reverse_field_mappings()
 
         # Extract fields from record
         model_data = {}
@@ -329,13 +333,30 @@ class AirtableModel(BaseModel, metaclass=AirtableModelMeta):
         for airtable_name, value in fields.items():
             mapping = reverse_mappings.get(airtable_name)
             if mapping:
-                parsed_value = TypeMapper.parse_value_from_airtable(
-                    value, mapping['airtable_type']
+                model_data[mapping['python_name']] = (
+                    mapping['parse'](value) if value is not None else None
                 )
-                model_data[mapping['python_name']] = parsed_value
 
         return cls(**model_data)
 
+    @classmethod
+    def _get_reverse_field_mappings(cls) -> Dict[str, Dict[str, Any]]:
+        """Get Airtable field name -> mapping (with Python name), computed once per class"""
+        cached = cls.__dict__.get('_reverse_field_mappings')
+        if cached is not None:
+            return cached
+
+        reverse_mappings = {
+            mapping['airtable_name']: {
+                'python_name': field_name,
+                'airtable_type': mapping['airtable_type'],
+                'parse': mapping['parse'],
+            }
+            for field_name, mapping in cls._get_field_mappings().items()
+        }
+        cls._reverse_field_mappings = reverse_mappings
+        return reverse_mappings
+
     # CRUD Operations
 
     def save(self) -> 'AirtableModel':
@@ -8,8 +8,15 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 import requests
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
 from .exceptions import APIError, RecordNotFoundError
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class AirtableClient:
     """
@@ -63,10 +70,14 @@ class AirtableClient:
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions"""
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
-            data = {"error": {"message": response.text}}
+        # Empty bodies (e.g. some DELETE responses) have nothing to parse
+        if not response.content:
+            data = {}
+        else:
+            try:
+                data = _json_loads(response.content)
+            except json.JSONDecodeError:
+                data = {"error": {"message": response.text}}
 
         if not response.ok:
             error_message = data.get("error", {}).get("message", f"HTTP {response.status_code}")
@@ -83,6 +94,10 @@ class AirtableClient:
         max_retries = 3
         base_delay = 1.0
 
+        # Encode the JSON body once (not per retry), using orjson when available
+        if orjson is not None and kwargs.get("json") is not None:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"), option=orjson.OPT_NON_STR_KEYS)
+
         for attempt in range(max_retries + 1):
             try:
                 response = func(*args, **kwargs)
@@ -3,7 +3,7 @@ Streamlined configuration management for Airtable connections
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional
 
 from .exceptions import ConfigurationError
@@ -93,11 +93,7 @@ class AirtableConfig:
         Returns:
             New AirtableConfig instance
         """
-        return AirtableConfig(
-            access_token=self.access_token,
-            base_id=self.base_id,
-            table_name=table_name
-        )
+        return replace(self, table_name=table_name)
     
     def validate_table_name(self, table_name: Optional[str] = None) -> str:
         """
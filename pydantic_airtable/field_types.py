@@ -3,6 +3,7 @@ Streamlined field type system with field type detection and minimal boilerplate
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Optional, Type, Union, get_origin, get_args
 from datetime import datetime, date, timedelta
 from enum import Enum
@@ -125,6 +126,17 @@ class FieldTypeResolver:
         r'_ranking$',       # Ends with _ranking
     ]
     
+    # Each category compiled once into a single alternation; searching it
+    # matches exactly when any of the category's patterns would
+    _EMAIL_RE = re.compile('|'.join(EMAIL_PATTERNS))
+    _URL_RE = re.compile('|'.join(URL_PATTERNS))
+    _PHONE_RE = re.compile('|'.join(PHONE_PATTERNS))
+    _LONG_TEXT_RE = re.compile('|'.join(LONG_TEXT_PATTERNS))
+    _CURRENCY_RE = re.compile('|'.join(CURRENCY_PATTERNS))
+    _PERCENT_RE = re.compile('|'.join(PERCENT_PATTERNS))
+    _DURATION_RE = re.compile('|'.join(DURATION_PATTERNS))
+    _RATING_RE = re.compile('|'.join(RATING_PATTERNS))
+    
     @classmethod
     def resolve_field_type(
         cls,
@@ -162,17 +174,30 @@ class FieldTypeResolver:
             if isinstance(extra, dict) and 'airtable_field_type' in extra:
                 return extra['airtable_field_type']
         
+        # 3-6 only depend on the name and annotation, so they are cached
+        try:
+            hash(python_type)
+        except TypeError:
+            # Unhashable annotation (e.g. Annotated with list metadata): resolve uncached
+            return cls._resolve_from_name_and_type.__wrapped__(cls, field_name, python_type)
+        return cls._resolve_from_name_and_type(field_name, python_type)
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _resolve_from_name_and_type(cls, field_name: str, python_type: Type) -> AirtableFieldType:
+        """Resolve field type from field name and Python type (steps 3-6 of resolve_field_type)"""
+        # Unwrap Optional/Union/generics once; steps 3-5 all work on the base type
+        base_type = cls._extract_base_type(python_type)
+        
         # 3. Type detection from field name (for string types)
-        if cls._is_string_type(python_type):
+        if base_type == str:
             auto_type = cls._detect_from_field_name(field_name)
             if auto_type:
                 return auto_type
         
         # 4. Python type mapping
-        base_type = cls._extract_base_type(python_type)
-        if base_type in cls.PYTHON_TO_AIRTABLE:
-            airtable_type = cls.PYTHON_TO_AIRTABLE[base_type]
-            
+        airtable_type = cls.PYTHON_TO_AIRTABLE.get(base_type)
+        if airtable_type is not None:
             # Further refinement for numbers
             if airtable_type == AirtableFieldType.NUMBER:
                 return cls._refine_number_type(field_name)
@@ -180,25 +205,12 @@ class FieldTypeResolver:
             return airtable_type
         
         # 5. Handle enums
-        if cls._is_enum_type(python_type):
+        if isinstance(base_type, type) and issubclass(base_type, Enum):
             return AirtableFieldType.SELECT
         
         # 6. Default fallback
         return AirtableFieldType.SINGLE_LINE_TEXT
     
-    @classmethod
-    def _is_string_type(cls, python_type: Type) -> bool:
-        """Check if type is string-based"""
-        base_type = cls._extract_base_type(python_type)
-        return base_type == str
-    
-    @classmethod
-    def _is_enum_type(cls, python_type: Type) -> bool:
-        """Check if type is enum-based"""
-        base_type = cls._extract_base_type(python_type)
-        return (isinstance(base_type, type) and 
-                issubclass(base_type, Enum))
-    
     @classmethod
     def _extract_base_type(cls, python_type: Type) -> Type:
         """
@@ -225,10 +237,14 @@ class FieldTypeResolver:
         return python_type
     
     @classmethod
+    @lru_cache(maxsize=256)
     def _detect_from_field_name(cls, field_name: str) -> Optional[AirtableFieldType]:
         """
         Field type detection based on field name patterns
         
+        Results are cached per field name; models commonly share names
+        like 'name', 'description' or 'notes'.
+        
         Args:
             field_name: Field name to analyze
             
@@ -238,24 +254,25 @@ class FieldTypeResolver:
         name_lower = field_name.lower()
         
         # Email detection
-        if any(re.search(pattern, name_lower) for pattern in cls.EMAIL_PATTERNS):
+        if cls._EMAIL_RE.search(name_lower):
             return AirtableFieldType.EMAIL
         
         # URL detection  
-        if any(re.search(pattern, name_lower) for pattern in cls.URL_PATTERNS):
+        if cls._URL_RE.search(name_lower):
             return AirtableFieldType.URL
         
         # Phone detection
-        if any(re.search(pattern, name_lower) for pattern in cls.PHONE_PATTERNS):
+        if cls._PHONE_RE.search(name_lower):
             return AirtableFieldType.PHONE
         
         # Long text detection
-        if any(re.search(pattern, name_lower) for pattern in cls.LONG_TEXT_PATTERNS):
+        if cls._LONG_TEXT_RE.search(name_lower):
             return AirtableFieldType.LONG_TEXT
         
         return None
     
     @classmethod
+    @lru_cache(maxsize=256)
     def _refine_number_type(cls, field_name: str) -> AirtableFieldType:
         """
         Refine number type based on field name
@@ -269,19 +286,19 @@ class FieldTypeResolver:
         name_lower = field_name.lower()
         
         # Currency detection
-        if any(re.search(pattern, name_lower) for pattern in cls.CURRENCY_PATTERNS):
+        if cls._CURRENCY_RE.search(name_lower):
             return AirtableFieldType.CURRENCY
         
         # Percentage detection
-        if any(re.search(pattern, name_lower) for pattern in cls.PERCENT_PATTERNS):
+        if cls._PERCENT_RE.search(name_lower):
             return AirtableFieldType.PERCENT
         
         # Duration detection (for int/float fields named like durations)
-        if any(re.search(pattern, name_lower) for pattern in cls.DURATION_PATTERNS):
+        if cls._DURATION_RE.search(name_lower):
             return AirtableFieldType.DURATION
         
         # Rating detection (for int fields named like ratings)
-        if any(re.search(pattern, name_lower) for pattern in cls.RATING_PATTERNS):
+        if cls._RATING_RE.search(name_lower):
             return AirtableFieldType.RATING
         
         return AirtableFieldType.NUMBER
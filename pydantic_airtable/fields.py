@@ -2,7 +2,9 @@
 Airtable field definitions and type mappings
 """
 
-from typing import Any, Optional, Type
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Optional, Type
 from datetime import datetime, date, timedelta
 from pydantic import Field
 from enum import Enum
@@ -69,17 +71,118 @@ def AirtableField(
         read_only: Whether this field should be excluded from create/update operations
         **kwargs: Additional Pydantic Field arguments
     """
-    json_schema_extra = kwargs.get("json_schema_extra", {})
-    json_schema_extra.update({
+    airtable_metadata = {
         "airtable_field_name": airtable_field_name,
         "airtable_field_type": airtable_field_type,
         "airtable_read_only": read_only,
-    })
-    kwargs["json_schema_extra"] = json_schema_extra
+    }
+    json_schema_extra = kwargs.get("json_schema_extra")
+    if json_schema_extra is None:
+        kwargs["json_schema_extra"] = airtable_metadata
+    else:
+        json_schema_extra.update(airtable_metadata)
 
     return Field(**kwargs)
 
 
+def _format_datetime(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _format_date(value: Any) -> Any:
+    # isoformat emits YYYY-MM-DD directly, without going through strftime
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _format_duration(value: Any) -> Any:
+    # Airtable stores duration as total seconds (integer)
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+    if isinstance(value, (int, float)):
+        return int(value)
+    return value
+
+
+def _format_number(value: Any) -> Any:
+    # bool can't be subclassed, so an identity check is equivalent to isinstance
+    return value if value.__class__ is bool else float(value)
+
+
+# datetime.fromisoformat accepts a trailing 'Z' (UTC) from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+# Records in a page often share timestamps and dates, and the parsed objects are
+# immutable, so parses are cached by their source string
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        # Before Python 3.11 fromisoformat requires zero-padding ('2024-01-05');
+        # keep accepting what strptime did, e.g. '2024-1-5'
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _parse_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return _parse_iso_datetime(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _parse_date(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return _parse_iso_date(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _parse_duration(value: Any) -> Any:
+    # Airtable returns duration as total seconds (integer)
+    if isinstance(value, (int, float)):
+        return timedelta(seconds=value)
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Per-type converters, looked up once per value instead of walking an if/elif chain
+_FORMATTERS = {
+    AirtableFieldType.DATETIME: _format_datetime,
+    AirtableFieldType.DATE: _format_date,
+    AirtableFieldType.DURATION: _format_duration,
+    AirtableFieldType.CHECKBOX: bool,
+    AirtableFieldType.NUMBER: _format_number,
+    AirtableFieldType.CURRENCY: _format_number,
+    AirtableFieldType.PERCENT: _format_number,
+}
+
+_PARSERS = {
+    AirtableFieldType.DATETIME: _parse_datetime,
+    AirtableFieldType.DATE: _parse_date,
+    AirtableFieldType.DURATION: _parse_duration,
+    AirtableFieldType.CHECKBOX: bool,
+}
+
+
 class TypeMapper:
     """Maps Python types to Airtable field types"""
 
@@ -104,24 +207,17 @@ class TypeMapper:
         if value is None:
             return None
 
-        if field_type == AirtableFieldType.DATETIME:
-            if isinstance(value, datetime):
-                return value.isoformat()
-        elif field_type == AirtableFieldType.DATE:
-            if isinstance(value, (datetime, date)):
-                return value.strftime("%Y-%m-%d")
-        elif field_type == AirtableFieldType.DURATION:
-            # Airtable stores duration as total seconds (integer)
-            if isinstance(value, timedelta):
-                return int(value.total_seconds())
-            elif isinstance(value, (int, float)):
-                return int(value)
-        elif field_type == AirtableFieldType.CHECKBOX:
-            return bool(value)
-        elif field_type in [AirtableFieldType.NUMBER, AirtableFieldType.CURRENCY, AirtableFieldType.PERCENT]:
-            return float(value) if not isinstance(value, bool) else value
-
-        return value
+        formatter = _FORMATTERS.get(field_type)
+        return formatter(value) if formatter is not None else value
+
+    @classmethod
+    def make_formatter(cls, field_type: AirtableFieldType) -> Callable[[Any], Any]:
+        """
+        Get the formatter for a field type, to look it up once when formatting
+        many values of that type. Unlike format_value_for_airtable, the returned
+        callable does not special-case None.
+        """
+        return _FORMATTERS.get(field_type, _identity)
 
     @classmethod
     def parse_value_from_airtable(cls, value: Any, field_type: AirtableFieldType) -> Any:
@@ -129,23 +225,14 @@ class TypeMapper:
         if value is None:
             return None
 
-        if field_type == AirtableFieldType.DATETIME:
-            if isinstance(value, str):
-                try:
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                except ValueError:
-                    return value
-        elif field_type == AirtableFieldType.DATE:
-            if isinstance(value, str):
-                try:
-                    return datetime.strptime(value, "%Y-%m-%d").date()
-                except ValueError:
-                    return value
-        elif field_type == AirtableFieldType.DURATION:
-            # Airtable returns duration as total seconds (integer)
-            if isinstance(value, (int, float)):
-                return timedelta(seconds=value)
-        elif field_type == AirtableFieldType.CHECKBOX:
-            return bool(value)
-
-        return value
+        parser = _PARSERS.get(field_type)
+        return parser(value) if parser is not None else value
+
+    @classmethod
+    def make_parser(cls, field_type: AirtableFieldType) -> Callable[[Any], Any]:
+        """
+        Get the parser for a field type, to look it up once when parsing many
+        values of that type. Unlike parse_value_from_airtable, the returned
+        callable does not special-case None.
+        """
+        return _PARSERS.get(field_type, _identity)
@@ -3,12 +3,28 @@ Unified HTTP client for all Airtable operations
 """
 
 import json
+import math
+import random
+import re
+import threading
 import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from importlib.metadata import version, PackageNotFoundError
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 from .exceptions import APIError, RecordNotFoundError
 
 
@@ -21,6 +37,112 @@ def _get_user_agent() -> str:
     return f"pydantic-airtable/{pkg_version}"
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP-date) into seconds, None if invalid"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
+
+
+# Pooled sessions shared by all clients using the same access token, so that
+# every model/manager reuses the same keep-alive connections
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_session(access_token: str) -> requests.Session:
+    """Get (or create) the pooled session for an access token"""
+    session = _sessions.get(access_token)
+    if session is not None:
+        return session
+    
+    with _sessions_lock:
+        # Another thread may have created it while we waited for the lock
+        session = _sessions.get(access_token)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                "User-Agent": _get_user_agent()
+            })
+            _sessions[access_token] = session
+    return session
+
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter
+    
+    Remembers the most recent request times and, once the window is full,
+    sleeps just long enough to stay under `max_requests` per `period` seconds.
+    Pacing requests this way avoids Airtable's 429 responses, which come
+    with a 30 second penalty.
+    """
+    
+    def __init__(self, max_requests: int = 5, period: float = 1.0):
+        """
+        Initialize rate limiter
+        
+        Args:
+            max_requests: Maximum requests allowed per period
+            period: Window length in seconds
+        """
+        self.max_requests = max_requests
+        self.period = period
+        self._timestamps: Deque[float] = deque(maxlen=max_requests)
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until another request may be sent"""
+        with self._lock:
+            if len(self._timestamps) == self.max_requests:
+                wait = self.period - (time.monotonic() - self._timestamps[0])
+                if wait > 0:
+                    time.sleep(wait)
+            self._timestamps.append(time.monotonic())
+
+
+# Rate limiters keyed by base ID (Airtable allows 5 requests per second per base)
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+_BASE_ID_PATTERN = re.compile(r"/(app[A-Za-z0-9]+)")
+
+
+def _get_rate_limiter(url: str) -> Optional[RateLimiter]:
+    """Get the rate limiter for the base a URL targets (None if no base in URL)"""
+    match = _BASE_ID_PATTERN.search(url)
+    if not match:
+        return None
+    
+    base_id = match.group(1)
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(base_id)
+        if limiter is None:
+            limiter = RateLimiter(
+                BaseHTTPClient.RATE_LIMIT_REQUESTS, BaseHTTPClient.RATE_LIMIT_PERIOD
+            )
+            _rate_limiters[base_id] = limiter
+    return limiter
+
+
 class BaseHTTPClient:
     """
     Unified HTTP client for all Airtable API operations
@@ -30,23 +152,30 @@ class BaseHTTPClient:
     BASE_URL = "https://api.airtable.com/v0"
     META_API_URL = "https://api.airtable.com/v0/meta"
     
+    # Client-side pacing per base, just under Airtable's documented 5 requests/second
+    RATE_LIMIT_REQUESTS = 5
+    RATE_LIMIT_PERIOD = 1.0
+    
+    # Upper bound on a server-requested Retry-After wait (seconds)
+    MAX_RETRY_AFTER = 60.0
+    
     def __init__(self, access_token: str):
         """
         Initialize HTTP client
         
         Args:
             access_token: Airtable Personal Access Token
+        
+        Note:
+            `session` is shared by every client using the same access token.
+            Changing its headers or other settings affects all of them; pass
+            per-request headers via `headers=` instead.
         """
         if not access_token:
             raise ValueError("access_token is required")
             
         self.access_token = access_token
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "User-Agent": _get_user_agent()
-        })
+        self.session = _get_session(access_token)
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -62,10 +191,14 @@ class BaseHTTPClient:
             APIError: For API errors
             RecordNotFoundError: For 404 record errors
         """
-        try:
-            data = response.json()
-        except (json.JSONDecodeError, ValueError):
-            data = {"error": {"message": response.text}}
+        # Empty bodies (e.g. some DELETE responses) have nothing to parse
+        if not response.content:
+            data = {}
+        else:
+            try:
+                data = _json_loads(response.content)
+            except (json.JSONDecodeError, ValueError):
+                data = {"error": {"message": response.text}}
         
         if not response.ok:
             error_info = data.get("error", {})
@@ -106,9 +239,17 @@ class BaseHTTPClient:
             Parsed response data
         """
         last_exception = None
+        limiter = _get_rate_limiter(args[0]) if args else None
+        
+        # Encode the JSON body once (not per retry), using orjson when available
+        if orjson is not None and kwargs.get("json") is not None:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"), option=orjson.OPT_NON_STR_KEYS)
         
         for attempt in range(max_retries + 1):
+            response = None
             try:
+                if limiter:
+                    limiter.acquire()
                 response = func(*args, **kwargs)
                 return self._handle_response(response)
                 
@@ -117,8 +258,7 @@ class BaseHTTPClient:
                 
                 # Retry on rate limit (status 429) or server errors (5xx)
                 if e.status_code in (429, 502, 503, 504) and attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    time.sleep(delay)
+                    time.sleep(self._retry_delay(attempt, base_delay, response))
                     continue
                 
                 # Re-raise if not retryable or max retries exceeded
@@ -129,8 +269,7 @@ class BaseHTTPClient:
                 
                 # Retry on network errors
                 if attempt < max_retries:
-                    delay = base_delay * (2 ** attempt)
-                    time.sleep(delay)
+                    time.sleep(self._retry_delay(attempt, base_delay))
                     continue
                 
                 # Convert to APIError for consistency
@@ -141,6 +280,36 @@ class BaseHTTPClient:
             raise last_exception
         raise APIError("Request failed after all retries")
     
+    @classmethod
+    def _retry_delay(
+        cls,
+        attempt: int,
+        base_delay: float,
+        response: Optional[requests.Response] = None
+    ) -> float:
+        """
+        Compute how long to wait before the next retry
+        
+        Honors the Retry-After header (seconds or an HTTP-date, capped at
+        MAX_RETRY_AFTER) when the server sends a valid one, otherwise uses
+        exponential backoff with jitter so parallel clients don't retry in lockstep
+        
+        Args:
+            attempt: Zero-based attempt number
+            base_delay: Base delay in seconds
+            response: Response that triggered the retry, if any
+            
+        Returns:
+            Delay in seconds
+        """
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, cls.MAX_RETRY_AFTER)
+        
+        delay = base_delay * (2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
+    
     # Convenience methods for different HTTP operations
     def get(self, url: str, **kwargs) -> Dict[str, Any]:
         """GET request with retry logic"""
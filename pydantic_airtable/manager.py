@@ -2,7 +2,11 @@
 Unified Airtable manager combining base and table operations
 """
 
-from typing import Any, Dict, List, Optional, Type, Union, get_type_hints
+import time
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union, get_type_hints
 from datetime import datetime, date, timedelta
 from enum import Enum
 
@@ -12,6 +16,16 @@ from .exceptions import APIError
 from .fields import AirtableFieldType
 
 
+class _FieldSpec(NamedTuple):
+    """Resolved Airtable details for one model field"""
+    field_info: Any
+    airtable_name: str
+    airtable_type: Any
+    python_type: Any
+    # Declared as AUTO_NUMBER, which is created as NUMBER instead
+    auto_number: bool = False
+
+
 class AirtableManager:
     """
     Unified manager for all Airtable operations including:
@@ -21,6 +35,33 @@ class AirtableManager:
     - Pydantic model integration (create tables from models, sync schemas)
     """
     
+    # Basic Python type -> Airtable field type mapping
+    PYTHON_TYPE_MAPPING = {
+        str: AirtableFieldType.SINGLE_LINE_TEXT,
+        int: AirtableFieldType.NUMBER,
+        float: AirtableFieldType.NUMBER,
+        bool: AirtableFieldType.CHECKBOX,
+        datetime: AirtableFieldType.DATETIME,
+        date: AirtableFieldType.DATE,
+        timedelta: AirtableFieldType.DURATION,
+        list: AirtableFieldType.MULTI_SELECT,
+    }
+    
+    # How long a fetched base schema is reused before hitting the Meta API again (seconds)
+    SCHEMA_CACHE_TTL = 60.0
+    
+    # (access token, base ID) -> (fetch time, schema). Shared by all managers so that
+    # a table created through one manager (e.g. a model's) invalidates it for every
+    # other, but keyed by token so a schema is only served to the token that fetched it
+    _schema_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+    
+    # (access token, base ID) -> (schema, table name -> table) index built over that schema object
+    _table_index_cache: Dict[Tuple[str, str], Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]] = {}
+    
+    # Model class -> resolved spec per field. Weakly keyed so dynamically created
+    # models can still be garbage-collected
+    _model_fields_cache: "weakref.WeakKeyDictionary[Type, Tuple[_FieldSpec, ...]]" = weakref.WeakKeyDictionary()
+    
     def __init__(self, config: AirtableConfig):
         """
         Initialize Airtable manager
@@ -30,6 +71,8 @@ class AirtableManager:
         """
         self.config = config
         self.client = BaseHTTPClient(config.access_token)
+        # (base ID, table name) -> records endpoint URL
+        self._records_urls: Dict[Tuple[str, str], str] = {}
     
     # =================================================================
     # BASE OPERATIONS
@@ -51,7 +94,14 @@ class AirtableManager:
             "name": name,
             "tables": tables
         }
-        return self.client.post(url, json=data)
+        base = self.client.post(url, json=data)
+        
+        # The response already describes the new base's tables, so seed the
+        # schema cache instead of making get_base_schema fetch them again
+        if base.get("id") and "tables" in base:
+            self._schema_cache[self._schema_key(base["id"])] = (time.monotonic(), {"tables": base["tables"]})
+        
+        return base
     
     def list_bases(self) -> List[Dict[str, Any]]:
         """
@@ -64,19 +114,82 @@ class AirtableManager:
         response = self.client.get(url)
         return response.get("bases", [])
     
-    def get_base_schema(self, base_id: Optional[str] = None) -> Dict[str, Any]:
+    def get_base_schema(
+        self, 
+        base_id: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Get schema for a base
         
+        Schemas are cached per access token and base for SCHEMA_CACHE_TTL
+        seconds and dropped whenever a manager changes tables in that base.
+        The returned dict is the cached object itself and must be treated
+        as read-only.
+        
         Args:
             base_id: Base ID (uses config default if None)
+            force_refresh: Bypass the cache and fetch a fresh schema
             
         Returns:
             Base schema information
         """
         target_base_id = base_id or self.config.base_id
+        key = self._schema_key(target_base_id)
+        
+        if not force_refresh:
+            cached = self._schema_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.SCHEMA_CACHE_TTL:
+                return cached[1]
+        
         url = self.client.build_meta_url("bases", target_base_id, "tables")
-        return self.client.get(url)
+        schema = self.client.get(url)
+        self._schema_cache[key] = (time.monotonic(), schema)
+        return schema
+
+    def get_base_schemas(
+        self,
+        base_ids: List[str],
+        force_refresh: bool = False,
+        max_workers: int = 5
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get schemas for several bases concurrently
+
+        Each base has its own rate limit, so the fetches can overlap; cached
+        schemas are returned without a request unless force_refresh is set.
+
+        Args:
+            base_ids: Base IDs to fetch
+            force_refresh: Bypass the schema cache and refetch
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Mapping of base ID to schema
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            schemas = executor.map(
+                lambda base_id: self.get_base_schema(base_id, force_refresh=force_refresh),
+                base_ids
+            )
+            return dict(zip(base_ids, schemas))
+
+    def invalidate_schema_cache(self, base_id: Optional[str] = None) -> None:
+        """
+        Drop cached base schema, for every access token
+        
+        Args:
+            base_id: Base ID (uses config default if None)
+        """
+        target_base_id = base_id or self.config.base_id
+        # list() snapshots the keys in one step, so concurrent fetches can't break the loop
+        for key in list(self._schema_cache):
+            if key[1] == target_base_id:
+                self._schema_cache.pop(key, None)
+    
+    def _schema_key(self, base_id: str) -> Tuple[str, str]:
+        """Schema cache key for a base as seen by this manager's access token"""
+        return (self.config.access_token, base_id)
     
     def delete_base(self, base_id: str) -> Dict[str, Any]:
         """
@@ -89,8 +202,48 @@ class AirtableManager:
             Deletion confirmation
         """
         url = self.client.build_meta_url("bases", base_id)
+        self.invalidate_schema_cache(base_id)
         return self.client.delete(url)
     
+    def delete_bases(self, base_ids: List[str], max_workers: int = 5) -> List[Dict[str, Any]]:
+        """
+        Delete several bases concurrently
+        
+        Requests share the client's pooled connections; each base has its
+        own rate limit, so independent deletes can overlap.
+        
+        Args:
+            base_ids: Base IDs to delete
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Deletion confirmations, in the order of base_ids
+            
+        Raises:
+            APIError: If any deletion failed (after attempting all of them)
+        """
+        def delete(base_id: str) -> Any:
+            try:
+                return self.delete_base(base_id)
+            except APIError as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(delete, base_ids))
+        
+        failures = {
+            base_id: result for base_id, result in zip(base_ids, results)
+            if isinstance(result, APIError)
+        }
+        if failures:
+            details = "; ".join(f"{base_id}: {error}" for base_id, error in failures.items())
+            raise APIError(
+                f"Failed to delete {len(failures)} of {len(base_ids)} bases: {details}",
+                response_data={"failed": {base_id: e.response_data for base_id, e in failures.items()}}
+            )
+        
+        return results
+    
     # =================================================================
     # TABLE OPERATIONS  
     # =================================================================
@@ -119,7 +272,9 @@ class AirtableManager:
             "name": name,
             "fields": fields
         }
-        return self.client.post(url, json=data)
+        result = self.client.post(url, json=data)
+        self.invalidate_schema_cache(target_base_id)
+        return result
     
     def get_table_schema(
         self, 
@@ -134,14 +289,23 @@ class AirtableManager:
             base_id: Base ID (uses config default if None)
             
         Returns:
-            Table schema
+            Table schema (part of the cached base schema; treat as read-only)
         """
         target_base_id = base_id or self.config.base_id
         base_schema = self.get_base_schema(target_base_id)
         
-        for table in base_schema.get("tables", []):
-            if table.get("name") == table_name:
-                return table
+        # Index tables by name once per fetched schema; a refetch yields a new object
+        key = self._schema_key(target_base_id)
+        cached = self._table_index_cache.get(key)
+        if cached is None or cached[0] is not base_schema:
+            tables_by_name = {table.get("name"): table for table in base_schema.get("tables", [])}
+            self._table_index_cache[key] = (base_schema, tables_by_name)
+        else:
+            tables_by_name = cached[1]
+        
+        table = tables_by_name.get(table_name)
+        if table is not None:
+            return table
         
         raise APIError(f"Table '{table_name}' not found in base {target_base_id}")
     
@@ -164,7 +328,9 @@ class AirtableManager:
         """
         target_base_id = base_id or self.config.base_id
         url = self.client.build_meta_url("bases", target_base_id, "tables", table_id)
-        return self.client.patch(url, json=updates)
+        result = self.client.patch(url, json=updates)
+        self.invalidate_schema_cache(target_base_id)
+        return result
     
     def delete_table(
         self, 
@@ -183,7 +349,9 @@ class AirtableManager:
         """
         target_base_id = base_id or self.config.base_id
         url = self.client.build_meta_url("bases", target_base_id, "tables", table_id)
-        return self.client.delete(url)
+        result = self.client.delete(url)
+        self.invalidate_schema_cache(target_base_id)
+        return result
     
     # =================================================================
     # PYDANTIC MODEL INTEGRATION
@@ -335,6 +503,53 @@ class AirtableManager:
             List of Airtable field definitions
         """
         fields = []
+        
+        for field_info, airtable_field_name, airtable_field_type, python_type, auto_number in self._resolve_model_fields(model_class):
+            if auto_number:
+                # Warned here rather than during (cached) resolution so that it's
+                # reported on every conversion, attributed to the public method's caller
+                warnings.warn(
+                    f"Field '{airtable_field_name}' is specified as AUTO_NUMBER, but Airtable API "
+                    f"does not support creating AUTO_NUMBER fields. Creating as NUMBER instead. "
+                    f"To convert to Auto number, use the Airtable UI after table creation.",
+                    UserWarning,
+                    stacklevel=3
+                )
+            
+            field_def = {
+                "name": airtable_field_name,
+                "type": airtable_field_type.value if hasattr(airtable_field_type, 'value') else airtable_field_type
+            }
+            
+            # Add field-specific options. Metadata is read fresh since it may be updated
+            # after class creation (e.g. a linked_table_id known only once that table exists)
+            json_schema_extra = getattr(field_info, 'json_schema_extra', {}) or {}
+            options = self._get_field_options(airtable_field_type, json_schema_extra, field_info, python_type)
+            if options:
+                field_def["options"] = options
+            
+            fields.append(field_def)
+        
+        return fields
+    
+    def _resolve_model_fields(self, model_class: Type) -> Tuple[_FieldSpec, ...]:
+        """
+        Resolve each model field's Airtable name and type
+        
+        Resolution (type hints, type detection) only depends on the class,
+        so it is done once per model class and shared by all managers.
+        
+        Args:
+            model_class: Pydantic model class
+            
+        Returns:
+            Resolved spec per field
+        """
+        cached = self._model_fields_cache.get(model_class)
+        if cached is not None:
+            return cached
+        
+        resolved = []
         type_hints = get_type_hints(model_class)
         
         # Skip internal fields
@@ -348,33 +563,22 @@ class AirtableManager:
             json_schema_extra = getattr(field_info, 'json_schema_extra', {}) or {}
             airtable_field_name = json_schema_extra.get('airtable_field_name', field_name)
             airtable_field_type = json_schema_extra.get('airtable_field_type')
+            python_type = type_hints.get(field_name, str)
             
             # Auto-detect field type if not specified
             if not airtable_field_type:
-                python_type = type_hints.get(field_name, str)
                 airtable_field_type = self._python_type_to_airtable_type(python_type)
             
             # Handle AUTO_NUMBER - Airtable API doesn't support creating AUTO_NUMBER fields
-            if airtable_field_type == AirtableFieldType.AUTO_NUMBER:
-                print(f"⚠️  Warning: Field '{airtable_field_name}' is specified as AUTO_NUMBER, but Airtable API "
-                      f"does not support creating AUTO_NUMBER fields. Creating as NUMBER instead. "
-                      f"To convert to Auto number, use the Airtable UI after table creation.")
+            auto_number = airtable_field_type == AirtableFieldType.AUTO_NUMBER
+            if auto_number:
                 airtable_field_type = AirtableFieldType.NUMBER
             
-            field_def = {
-                "name": airtable_field_name,
-                "type": airtable_field_type.value if hasattr(airtable_field_type, 'value') else airtable_field_type
-            }
-            
-            # Add field-specific options
-            python_type = type_hints.get(field_name, str)
-            options = self._get_field_options(airtable_field_type, json_schema_extra, field_info, python_type)
-            if options:
-                field_def["options"] = options
-            
-            fields.append(field_def)
+            resolved.append(_FieldSpec(field_info, airtable_field_name, airtable_field_type, python_type, auto_number))
         
-        return fields
+        # Stored as a flat tuple: cheap to iterate and safe to share between callers
+        resolved = self._model_fields_cache[model_class] = tuple(resolved)
+        return resolved
     
     def _get_field_options(self, field_type: AirtableFieldType, json_schema_extra: Dict[str, Any], field_info=None, python_type=None) -> Optional[Dict[str, Any]]:
         """
@@ -512,18 +716,6 @@ class AirtableManager:
             if non_none_args:
                 python_type = non_none_args[0]
         
-        # Basic type mapping
-        type_mapping = {
-            str: AirtableFieldType.SINGLE_LINE_TEXT,
-            int: AirtableFieldType.NUMBER,
-            float: AirtableFieldType.NUMBER,
-            bool: AirtableFieldType.CHECKBOX,
-            datetime: AirtableFieldType.DATETIME,
-            date: AirtableFieldType.DATE,
-            timedelta: AirtableFieldType.DURATION,
-            list: AirtableFieldType.MULTI_SELECT,
-        }
-        
         # Handle string subtypes by field name patterns
         if python_type == str:
             # Could add email detection, URL detection, etc.
@@ -533,7 +725,7 @@ class AirtableManager:
         if isinstance(python_type, type) and issubclass(python_type, Enum):
             return AirtableFieldType.SELECT
         
-        return type_mapping.get(python_type, AirtableFieldType.SINGLE_LINE_TEXT)
+        return self.PYTHON_TYPE_MAPPING.get(python_type, AirtableFieldType.SINGLE_LINE_TEXT)
     
     # =================================================================
     # RECORD OPERATIONS (delegated to client with table-specific URLs)
@@ -543,7 +735,11 @@ class AirtableManager:
         """Build URL for record operations"""
         target_base_id = base_id or self.config.base_id
         target_table = table_name or self.config.validate_table_name()
-        return self.client.build_url(target_base_id, target_table)
+        key = (target_base_id, target_table)
+        url = self._records_urls.get(key)
+        if url is None:
+            url = self._records_urls[key] = self.client.build_url(target_base_id, target_table)
+        return url
     
     def get_records(
         self, 
@@ -565,6 +761,42 @@ class AirtableManager:
         url = self._get_records_url(table_name, base_id)
         return self.client.post(url, json={"fields": fields})
     
+    def create_records(
+        self, 
+        records: List[Dict[str, Any]], 
+        table_name: Optional[str] = None,
+        base_id: Optional[str] = None,
+        fields_to_merge_on: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple records using the batch endpoint
+        
+        Args:
+            records: List of field dictionaries
+            table_name: Table name (uses config default if None)
+            base_id: Base ID (uses config default if None)
+            fields_to_merge_on: Airtable field names identifying existing records;
+                when given, matching records are updated instead of duplicated (upsert)
+            
+        Returns:
+            List of created (or updated) records
+        """
+        url = self._get_records_url(table_name, base_id)
+        created = []
+        
+        # Airtable API accepts up to 10 records per batch request
+        batch_size = 10
+        for i in range(0, len(records), batch_size):
+            payload = {"records": [{"fields": fields} for fields in records[i:i + batch_size]]}
+            if fields_to_merge_on:
+                payload["performUpsert"] = {"fieldsToMergeOn": fields_to_merge_on}
+                response = self.client.patch(url, json=payload)
+            else:
+                response = self.client.post(url, json=payload)
+            created.extend(response.get("records", []))
+        
+        return created
+    
     def get_record(
         self, 
         record_id: str, 
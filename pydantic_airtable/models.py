@@ -2,8 +2,8 @@
 Streamlined model system with decorators and defaults
 """
 
-from typing import Any, Dict, List, Optional, Type, ClassVar, get_type_hints
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Type, ClassVar, get_type_hints
+from datetime import date, datetime, timedelta
 from pydantic import BaseModel, ConfigDict
 
 from .config import AirtableConfig, get_global_config
@@ -12,6 +12,10 @@ from .field_types import FieldTypeResolver
 from .exceptions import ConfigurationError
 
 
+# Types that are sent to Airtable as-is
+_PLAIN_TYPES = (str, int, float, bool)
+
+
 class AirtableModel(BaseModel):
     """
     Streamlined base class for Airtable models
@@ -22,6 +26,9 @@ class AirtableModel(BaseModel):
     # Configuration will be set by decorator or class definition
     _airtable_config: ClassVar[Optional[AirtableConfig]] = None
     _airtable_manager: ClassVar[Optional[AirtableManager]] = None
+    _field_mappings: ClassVar[Optional[Dict[str, Dict[str, Any]]]] = None
+    _reverse_field_mappings: ClassVar[Optional[Dict[str, str]]] = None
+    _formula_templates: ClassVar[Optional[Dict[tuple, str]]] = None
     
     # Standard Airtable fields
     id: Optional[str] = None
@@ -123,53 +130,170 @@ class AirtableModel(BaseModel):
         Returns:
             List of model instances
         """
-        manager = cls._get_manager()
-        table_name = cls._get_table_name()
+        return list(cls.iter_all(**filters))
+    
+    @classmethod
+    def iter_all(cls, **filters) -> Iterator['AirtableModel']:
+        """
+        Iterate over all records, fetching one page at a time
         
-        response = manager.get_records(table_name, **filters)
+        Only the current page is held in memory, and records from the first
+        page are available before later pages are requested.
         
-        records = []
-        for record_data in response.get('records', []):
-            records.append(cls._from_airtable_record(record_data))
+        Args:
+            **filters: Query parameters
+            
+        Yields:
+            Model instances
+        """
+        for record_data in cls._iter_records(**filters):
+            yield cls._from_airtable_record(record_data)
+    
+    @classmethod
+    def _iter_records(cls, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over raw Airtable records, following the offset cursor page by page
+        
+        Args:
+            **params: Query parameters
+            
+        Yields:
+            Record data as returned by the API
+        """
+        manager = cls._get_manager()
+        table_name = cls._get_table_name()
+        params = dict(params)
         
-        return records
+        while True:
+            response = manager.get_records(table_name, **params)
+            yield from response.get('records', [])
+            
+            offset = response.get('offset')
+            if not offset:
+                return
+            params['offset'] = offset
     
     @classmethod
-    def find_by(cls, **filters) -> List['AirtableModel']:
+    def find_by(cls, *, _fields: Optional[List[str]] = None, **filters) -> List['AirtableModel']:
         """
         Find records by field values
         
         Args:
+            _fields: Field names to fetch (all fields if None); other fields
+                get their defaults, so include every required field. The
+                leading underscore keeps it apart from model field filters
             **filters: Field name -> value filters
             
         Returns:
             List of matching model instances
         """
-        # Convert filters to Airtable formula
-        formula_parts = []
-        for field_name, value in filters.items():
-            airtable_field_name = cls._get_airtable_field_name(field_name)
+        return list(cls.iter_find_by(_fields=_fields, **filters))
+    
+    @classmethod
+    def iter_find_by(cls, *, _fields: Optional[List[str]] = None, **filters) -> Iterator['AirtableModel']:
+        """
+        Iterate over records matching field values, fetching one page at a time
+        
+        Args:
+            _fields: Field names to fetch (all fields if None)
+            **filters: Field name -> value filters
+            
+        Yields:
+            Matching model instances
+        """
+        params = {}
+        formula = cls._build_filter_formula(filters)
+        if formula:
+            params['filterByFormula'] = formula
+        if _fields:
+            # Let Airtable return just these columns
+            params['fields[]'] = [cls._get_airtable_field_name(name) for name in _fields]
+        
+        return cls.iter_all(**params)
+    
+    @classmethod
+    def count(cls, **filters) -> int:
+        """
+        Count records matching field values
+        
+        Pages through the table without building model instances.
+        
+        Args:
+            **filters: Field name -> value filters
             
+        Returns:
+            Number of matching records
+        """
+        params = {}
+        formula = cls._build_filter_formula(filters)
+        if formula:
+            params['filterByFormula'] = formula
+        
+        return sum(1 for _ in cls._iter_records(**params))
+    
+    @classmethod
+    def _build_filter_formula(cls, filters: Dict[str, Any]) -> Optional[str]:
+        """
+        Convert field name -> value filters to an Airtable formula
+        
+        The formula shape only depends on which fields are filtered and the
+        kind of each value, so a %-template is built once per shape and
+        reused; each call just substitutes the values.
+        """
+        if not filters:
+            return None
+        
+        shape = []
+        values = []
+        for field_name, value in filters.items():
             if isinstance(value, bool):
-                # Handle boolean fields - use just the field name for true, empty for false
-                if value:
-                    formula_parts.append(f"{{{airtable_field_name}}}")
-                else:
-                    formula_parts.append(f"NOT({{{airtable_field_name}}})")
-            elif isinstance(value, str):
-                formula_parts.append(f"{{{airtable_field_name}}} = '{value}'")
+                # Booleans are part of the shape: true -> {field}, false -> NOT({field})
+                shape.append((field_name, value))
+                continue
+            
+            # Compare against the stored form: enum values, ISO dates
+            value = cls._serialize_value(value)
+            if isinstance(value, str):
+                shape.append((field_name, str))
+                # Escape so quotes in the value can't end the formula string
+                values.append(value.replace("\\", "\\\\").replace("'", "\\'"))
             else:
-                formula_parts.append(f"{{{airtable_field_name}}} = {value}")
+                shape.append((field_name, None))
+                values.append(f"{value}")
+        shape = tuple(shape)
+        
+        templates = cls.__dict__.get('_formula_templates')
+        if templates is None:
+            templates = cls._formula_templates = {}
+        
+        template = templates.get(shape)
+        if template is None:
+            template = templates[shape] = cls._compile_filter_template(shape)
         
-        if formula_parts:
-            # Use AND() function for multiple conditions, single condition without wrapper
-            if len(formula_parts) > 1:
-                formula = "AND(" + ", ".join(formula_parts) + ")"
+        return template % tuple(values)
+    
+    @classmethod
+    def _compile_filter_template(cls, shape: tuple) -> str:
+        """Build the %-template for a filter shape from _build_filter_formula"""
+        formula_parts = []
+        for field_name, kind in shape:
+            # Escape '%' so field names survive the later substitution
+            field_ref = "{" + cls._get_airtable_field_name(field_name).replace("%", "%%") + "}"
+            
+            if kind is True:
+                # Handle boolean fields - use just the field name for true, empty for false
+                formula_parts.append(field_ref)
+            elif kind is False:
+                formula_parts.append(f"NOT({field_ref})")
+            elif kind is str:
+                formula_parts.append(f"{field_ref} = '%s'")
             else:
-                formula = formula_parts[0]
-            return cls.all(filterByFormula=formula)
+                formula_parts.append(f"{field_ref} = %s")
         
-        return cls.all()
+        # Use AND() function for multiple conditions, single condition without wrapper
+        if len(formula_parts) > 1:
+            return "AND(" + ", ".join(formula_parts) + ")"
+        return formula_parts[0]
     
     @classmethod
     def first(cls, **filters) -> Optional['AirtableModel']:
@@ -182,35 +306,41 @@ class AirtableModel(BaseModel):
         Returns:
             First matching model instance or None
         """
-        results = cls.find_by(**filters)
-        return results[0] if results else None
+        # Stop after the first page instead of fetching every match
+        return next(cls.iter_find_by(**filters), None)
     
     @classmethod
-    def bulk_create(cls, data_list: List[Dict[str, Any]]) -> List['AirtableModel']:
+    def bulk_create(
+        cls, 
+        data_list: List[Dict[str, Any]], 
+        upsert_on: Optional[List[str]] = None
+    ) -> List['AirtableModel']:
         """
         Create multiple records in batch
         
         Args:
             data_list: List of field value dictionaries
+            upsert_on: Field names identifying existing records; matching
+                records are updated instead of creating duplicates
             
         Returns:
-            List of created model instances
+            List of created (or updated) model instances
         """
-        created_records = []
+        airtable_records = [cls._to_airtable_fields(data) for data in data_list]
+        
+        manager = cls._get_manager()
+        table_name = cls._get_table_name()
         
-        # Airtable API supports up to 10 records per batch
-        batch_size = 10
+        fields_to_merge_on = None
+        if upsert_on:
+            fields_to_merge_on = [cls._get_airtable_field_name(name) for name in upsert_on]
         
-        for i in range(0, len(data_list), batch_size):
-            batch = data_list[i:i + batch_size]
-            
-            for data in batch:
-                # For now, create records individually
-                # Could be optimized to use batch API
-                record = cls.create(**data)
-                created_records.append(record)
+        # Manager sends up to 10 records per request (Airtable batch limit)
+        response = manager.create_records(
+            airtable_records, table_name, fields_to_merge_on=fields_to_merge_on
+        )
         
-        return created_records
+        return [cls._from_airtable_record(record) for record in response]
     
     def save(self) -> 'AirtableModel':
         """
@@ -222,7 +352,9 @@ class AirtableModel(BaseModel):
         if not self.id:
             raise ValueError("Cannot save record without ID. Use create() for new records.")
         
-        # Get changed fields
+        # Get changed fields. Defaults and None are kept: they may be deliberate
+        # changes that must reach Airtable. Values go through _serialize_value,
+        # like create() and bulk_create(), so every write sends the same format.
         changed_data = self.model_dump(exclude={'id', 'created_time'})
         airtable_data = self._to_airtable_fields(changed_data)
         
@@ -306,7 +438,17 @@ class AirtableModel(BaseModel):
     
     @classmethod
     def _get_field_mappings(cls) -> Dict[str, Dict[str, Any]]:
-        """Get field mappings for this model"""
+        """
+        Get field mappings for this model
+        
+        Mappings only depend on the class definition, so they are computed
+        once per class and reused by every create/read/query call.
+        """
+        # Look in the class's own namespace so subclasses don't reuse a parent's mappings
+        cached = cls.__dict__.get('_field_mappings')
+        if cached is not None:
+            return cached
+        
         mappings = {}
         type_hints = get_type_hints(cls)
         
@@ -334,8 +476,23 @@ class AirtableModel(BaseModel):
                 'python_type': type_hints.get(field_name)
             }
         
+        cls._field_mappings = mappings
         return mappings
     
+    @classmethod
+    def _get_reverse_field_mappings(cls) -> Dict[str, str]:
+        """Get Airtable field name -> Python field name mapping, computed once per class"""
+        cached = cls.__dict__.get('_reverse_field_mappings')
+        if cached is not None:
+            return cached
+        
+        reverse_mappings = {
+            mapping['airtable_name']: python_name 
+            for python_name, mapping in cls._get_field_mappings().items()
+        }
+        cls._reverse_field_mappings = reverse_mappings
+        return reverse_mappings
+    
     @classmethod
     def _get_airtable_field_name(cls, python_field_name: str) -> str:
         """Get Airtable field name for Python field name"""
@@ -373,12 +530,20 @@ class AirtableModel(BaseModel):
         Returns:
             Airtable-compatible value
         """
-        if value is None:
-            return None
+        # Plain scalars are the common case and need no conversion. The exact type
+        # check keeps str/int-based enums on the enum path below.
+        if value is None or type(value) in _PLAIN_TYPES:
+            return value
         
-        # Handle datetime objects
+        # Handle datetime and date objects (datetime first, it subclasses date)
         if isinstance(value, datetime):
             return value.isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        
+        # Airtable stores durations as a number of seconds
+        if isinstance(value, timedelta):
+            return value.total_seconds()
         
         # Handle enums
         if hasattr(value, 'value'):
@@ -402,10 +567,7 @@ class AirtableModel(BaseModel):
         mappings = cls._get_field_mappings()
         
         # Reverse mapping: Airtable name -> Python name
-        reverse_mappings = {
-            mapping['airtable_name']: python_name 
-            for python_name, mapping in mappings.items()
-        }
+        reverse_mappings = cls._get_reverse_field_mappings()
         
         # Convert field names
         python_data = {'id': record.get('id')}
@@ -482,6 +644,9 @@ def airtable_model(
             '__qualname__': getattr(cls, '__qualname__', cls.__name__),
             '_airtable_config': model_config,
             '_airtable_manager': None,
+            '_field_mappings': None,
+            '_reverse_field_mappings': None,
+            '_formula_templates': None,
         }
         
         # Create new class with multiple inheritance